@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, redirect, url_for, session
+from flask import Flask, render_template, request, redirect, url_for, session, g
 from dash import Dash, dcc, html
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output, State
@@ -6,14 +6,17 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objs as go
 import json
+import os
+import hashlib
+import threading
 import features
 
 # Initialize Flask
 app = Flask(__name__)
 app.secret_key = 'your_secret_key'
 
-# Initialize Dash with a light Bootstrap theme
-dash_app = Dash(__name__, server=app, url_base_pathname='/dashboard/', external_stylesheets=[dbc.themes.LUX])
+# Initialize Dash with a light Bootstrap theme; compress=True gzip/brotli-encodes responses via flask-compress
+dash_app = Dash(__name__, server=app, url_base_pathname='/dashboard/', external_stylesheets=[dbc.themes.LUX], compress=True)
 
 # Load merchant categorization rules from JSON file
 with open('data/merchant_categories.json') as f:
@@ -45,9 +48,22 @@ def categorize_transactions(transaction_df):
 # Load the Excel data for the dashboard and categorize transactions
 transaction_data = categorize_transactions(load_excel_data(excel_file_path))
 
+# Detect recurring payments in the loaded transactions (recurring_batch.py runs the incremental nightly job)
+recurring_payments, _ = features.detect_recurring_payments(transaction_data)
+
 # Load the month-wise income and expense data
 monthwise_data = load_excel_data(monthwise_income_expense_file)
 
+# Function to build a version string for the loaded dataset (changes whenever a source file changes)
+def get_dataset_version():
+    digest = hashlib.sha1()
+    for path in (excel_file_path, monthwise_income_expense_file, 'data/merchant_categories.json'):
+        stat = os.stat(path)
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()[:16]
+
+dataset_version = get_dataset_version()
+
 # Function to calculate total income, expenses, and savings
 def calculate_summary():
     income = transaction_data[transaction_data['Transaction Type'] == 'Credit']['Amount'].sum()
@@ -71,12 +87,20 @@ def get_progress_color(budget_percentage):
     else:
         return "danger"   # Red
 
+# Financial news file and its in-memory cache (reloaded only when the file's mtime changes)
+financial_news_file = 'data/financial_news.json'
+financial_news_cache = {'mtime': None, 'articles': []}
+
 # Function to fetch financial news from local JSON
 def fetch_financial_news():
     try:
-        with open('data/financial_news.json', 'r') as f:
-            news_data = json.load(f)
-            return news_data.get('articles', [])
+        mtime = os.path.getmtime(financial_news_file)
+        if financial_news_cache['mtime'] != mtime:
+            with open(financial_news_file, 'r') as f:
+                news_data = json.load(f)
+            financial_news_cache['articles'] = news_data.get('articles', [])
+            financial_news_cache['mtime'] = mtime
+        return financial_news_cache['articles']
     except Exception as e:
         return []
 
@@ -354,6 +378,9 @@ def render_tab_content(active_tab):
             dbc.Row([
                 dbc.Col(features.budget_setting_layout(), width=4),  # Budget settings from features.py
                 dbc.Col(features.budget_progress_layout(transaction_data), width=8)  # Progress tracking from features.py
+            ]),
+            dbc.Row([
+                dbc.Col(features.recurring_payments_layout(recurring_payments), width=12)  # Recurring charges from features.py
             ])
         ])
     return html.P("No tab selected")
@@ -465,6 +492,71 @@ def update_financial_news(_):
     else:
         return html.P("No news available at the moment.", style={"color": "black"})
 
+# --- HTTP caching for the dashboard ---
+
+# Callbacks whose output only depends on their inputs and the loaded dataset
+cacheable_callbacks = {render_tab_content, update_monthwise_income_expense, update_category_and_savings}
+
+# Dash output IDs of the cacheable callbacks, taken from the registered callbacks
+cacheable_outputs = {
+    output for output, callback in dash_app.callback_map.items()
+    if getattr(callback['callback'], '__wrapped__', None) in cacheable_callbacks
+}
+
+# Dash GET endpoints that are revalidated with ETag / If-None-Match on every page load
+conditional_get_paths = {
+    dash_app.config.requests_pathname_prefix + '_dash-layout',
+    dash_app.config.requests_pathname_prefix + '_dash-dependencies',
+}
+
+# Responses of cacheable callbacks, keyed by (dataset version, request body hash).
+# The server is threaded, so every read and write goes through the lock.
+callback_response_cache = {}
+callback_response_cache_lock = threading.Lock()
+max_cached_callback_responses = 256
+
+# Function to get the cache key of a cacheable callback request (None otherwise), worked out once per request
+def get_callback_cache_key():
+    if 'callback_cache_key' not in g:
+        g.callback_cache_key = None
+        if request.method == 'POST' and request.path.endswith('/_dash-update-component'):
+            payload = request.get_json(silent=True) or {}
+            if payload.get('output') in cacheable_outputs:
+                g.callback_cache_key = (dataset_version, hashlib.sha1(request.get_data()).hexdigest())
+    return g.callback_cache_key
+
+# Answer repeat callback requests from the cache before Dash recomputes the figures
+@app.before_request
+def serve_cached_callback():
+    key = get_callback_cache_key()
+    if key is None:
+        return None
+    with callback_response_cache_lock:
+        cached = callback_response_cache.get(key)
+    if cached is not None:
+        g.callback_cache_hit = True
+        return app.response_class(cached, mimetype='application/json')
+
+# Store fresh callback responses and add validators to the dashboard's GET endpoints
+@app.after_request
+def cache_dashboard_response(response):
+    if response.status_code != 200:
+        return response
+
+    key = get_callback_cache_key()
+    if key is not None and not g.get('callback_cache_hit'):
+        data = response.get_data()
+        with callback_response_cache_lock:
+            if len(callback_response_cache) >= max_cached_callback_responses:
+                callback_response_cache.pop(next(iter(callback_response_cache)))
+            callback_response_cache[key] = data
+    elif request.method in ('GET', 'HEAD') and request.path in conditional_get_paths:
+        # flask-compress appends the content encoding to this tag for compressed bodies
+        response.add_etag()
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.make_conditional(request)
+    return response
+
 # Flask route for login page
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -1,6 +1,7 @@
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 import pandas as pd
+import numpy as np
 import plotly.graph_objs as go
 from dash.dependencies import Input, Output, State
 
@@ -171,3 +172,181 @@ def savings_goals_layout(income):
             dcc.Graph(figure=fig)
         ])
     ], style={"box-shadow": "0 4px 8px rgba(0, 0, 0, 0.1)", "border-radius": "15px", "margin-top": "20px"})
+
+
+# --- Recurring Payment and Subscription Detection ---
+
+# Supported cadences: (expected days between charges, allowed deviation of the median interval)
+recurring_cadences = {
+    'Weekly': (7, 1),
+    'Biweekly': (14, 1.5),
+    'Monthly': (30.4, 2.5),
+}
+
+# Minimum number of charges before a group is considered recurring
+min_recurring_occurrences = 3
+
+# Only the most recent charges of each group are scored, so old price changes or gaps don't count forever
+recurring_window = 7
+
+# Share of recent intervals/amounts that must sit close to the group's median
+min_recurring_regularity = 0.75
+
+# Max relative distance from the median amount for a charge to count as "the same amount"
+max_amount_variation = 0.1
+
+# A group stops being reported after this many missed cadences (relative to the newest date in the data)
+max_missed_cadences = 2
+
+# Function to normalize descriptions so "NETFLIX.COM 1234" and "Netflix.com #5678" group together
+def normalize_description(descriptions):
+    return (
+        descriptions.astype(str)
+        .str.lower()
+        .str.replace(r'[^a-z\s]+', ' ', regex=True)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip()
+    )
+
+# Function to get the grouping keys (per user when the data has a user column)
+def get_recurring_group_keys(frame):
+    return ['User ID', 'Merchant Key'] if 'User ID' in frame.columns else ['Merchant Key']
+
+# Function to get the columns that identify a single charge across overlapping imports
+def get_charge_identity_columns(frame):
+    if 'Transaction ID' in frame.columns:
+        return ['Transaction ID']
+    return get_recurring_group_keys(frame) + ['Description', 'Date', 'Amount', 'Occurrence']
+
+# Function to turn raw transactions into normalized debit charges
+def prepare_recurring_charges(transaction_data):
+    debits = transaction_data[transaction_data['Transaction Type'] == 'Debit']
+    charges = pd.DataFrame({
+        'Merchant Key': normalize_description(debits['Description']),
+        'Description': debits['Description'].astype(str),
+        'Date': pd.to_datetime(debits['Date']),
+        'Amount': debits['Amount'].astype(float),
+    })
+    for column in ('User ID', 'Transaction ID'):
+        if column in debits.columns:
+            charges.insert(0, column, debits[column])
+    charges = charges[charges['Merchant Key'] != '']
+    # Numbers identical same-day charges so a genuine second charge isn't mistaken for a re-import
+    charges['Occurrence'] = charges.groupby(get_recurring_group_keys(charges) + ['Description', 'Date', 'Amount']).cumcount()
+    return charges
+
+# Function to compute per-group interval and amount statistics over each group's most recent charges
+def summarize_recurring_groups(charges):
+    keys = get_recurring_group_keys(charges)
+    charges = charges.sort_values(keys + ['Date'])
+    grouped = charges.groupby(keys, sort=False)
+    charges = charges.assign(**{
+        'Interval': grouped['Date'].diff().dt.days,
+        'Count': grouped['Date'].transform('size'),
+        'Recency': grouped.cumcount(ascending=False),
+    })
+
+    recent = charges[charges['Recency'] < recurring_window]
+    recent_grouped = recent.groupby(keys, sort=False)
+    median_interval = recent_grouped['Interval'].transform('median')
+    median_amount = recent_grouped['Amount'].transform('median')
+    recent = recent.assign(**{
+        'Regular Interval': ((recent['Interval'] - median_interval).abs() <= np.maximum(1, 0.1 * median_interval)).astype(float).where(recent['Interval'].notna()),
+        'Stable Amount': (recent['Amount'] - median_amount).abs() <= max_amount_variation * median_amount.abs(),
+    })
+
+    return recent.groupby(keys, sort=False).agg(**{
+        'Description': ('Description', 'last'),
+        'Count': ('Count', 'first'),
+        'Median Interval': ('Interval', 'median'),
+        'Interval Regularity': ('Regular Interval', 'mean'),
+        'Median Amount': ('Amount', 'median'),
+        'Amount Stability': ('Stable Amount', 'mean'),
+        'Last Date': ('Date', 'max'),
+    }).reset_index()
+
+# Function to fold one imported batch of transactions into the recurring-payment state.
+# The state holds every charge seen so far plus one summary row per group; only groups touched by the
+# new rows are re-summarized. Rows already in the history (overlapping imports) are ignored.
+# Call this once per import file: same-day occurrences are numbered within a batch, so overlapping
+# files concatenated into one batch would count their shared rows twice.
+def update_recurring_state(transaction_data, state=None):
+    charges = prepare_recurring_charges(transaction_data)
+    keys = get_recurring_group_keys(charges)
+    identity = get_charge_identity_columns(charges)
+    charges = charges.drop_duplicates(subset=identity)
+    if state is None:
+        return {'history': charges.reset_index(drop=True), 'summary': summarize_recurring_groups(charges)}
+
+    new_rows = charges.merge(state['history'][identity], on=identity, how='left', indicator=True)
+    new_rows = new_rows[new_rows['_merge'] == 'left_only'].drop(columns='_merge')
+    history = pd.concat([state['history'], new_rows], ignore_index=True)
+    touched = new_rows[keys].drop_duplicates()
+
+    touched_history = history.merge(touched, on=keys)
+    untouched_summary = state['summary'].merge(touched, on=keys, how='left', indicator=True)
+    untouched_summary = untouched_summary[untouched_summary['_merge'] == 'left_only'].drop(columns='_merge')
+    summary = pd.concat([untouched_summary, summarize_recurring_groups(touched_history)], ignore_index=True)
+    return {'history': history.reset_index(drop=True), 'summary': summary}
+
+# Function to pick out the still-active groups whose charges come at a steady cadence with a stable amount
+def find_recurring_payments(summary, as_of=None):
+    keys = get_recurring_group_keys(summary)
+    columns = keys + ['Description', 'Cadence', 'Average Amount', 'Count', 'Last Date', 'Next Expected Date']
+
+    # "Now" is the newest date in the data (per user when there are users) unless given explicitly
+    if as_of is not None:
+        newest_date = pd.Series(pd.Timestamp(as_of), index=summary.index)
+    elif 'User ID' in summary.columns:
+        newest_date = summary.groupby('User ID')['Last Date'].transform('max')
+    else:
+        newest_date = pd.Series(summary['Last Date'].max(), index=summary.index)
+
+    conditions = [
+        (summary['Median Interval'] - days).abs() <= tolerance
+        for days, tolerance in recurring_cadences.values()
+    ]
+    cadence = pd.Series(np.select(conditions, list(recurring_cadences), default=''), index=summary.index)
+    cadence_days = pd.Series(np.select(conditions, [days for days, _ in recurring_cadences.values()], default=np.nan), index=summary.index)
+    days_since_last = (newest_date - summary['Last Date']).dt.days
+
+    is_recurring = (
+        (cadence != '')
+        & (summary['Count'] >= min_recurring_occurrences)
+        & (summary['Interval Regularity'] >= min_recurring_regularity)
+        & (summary['Amount Stability'] >= min_recurring_regularity)
+        & (days_since_last <= max_missed_cadences * cadence_days)
+    )
+
+    recurring = summary[is_recurring].assign(**{
+        'Cadence': cadence[is_recurring],
+        'Average Amount': summary['Median Amount'][is_recurring].round(2),
+        'Next Expected Date': summary['Last Date'][is_recurring] + pd.to_timedelta(summary['Median Interval'][is_recurring].round(), unit='D'),
+    })
+    return recurring[columns].sort_values('Average Amount', ascending=False).reset_index(drop=True)
+
+# Function to detect recurring payments; pass the previous state to fold in only newly imported rows
+def detect_recurring_payments(transaction_data, state=None, as_of=None):
+    state = update_recurring_state(transaction_data, state)
+    return find_recurring_payments(state['summary'], as_of), state
+
+# Layout for the recurring payments card on the Budget Tracker tab
+def recurring_payments_layout(recurring_payments):
+    if recurring_payments.empty:
+        items = [html.P("No recurring charges detected.", style={"color": "#2c3e50"})]
+    else:
+        items = [html.Ul([
+            html.Li(
+                f"{row['Description']} - {row['Cadence']}, ~${row['Average Amount']:,.2f} "
+                f"(next around {row['Next Expected Date']:%Y-%m-%d})",
+                style={"color": "#2c3e50"}
+            )
+            for _, row in recurring_payments.iterrows()
+        ])]
+
+    return dbc.Card([
+        dbc.CardBody([
+            html.H5("Recurring Payments & Subscriptions", className="card-title", style={"color": "#2c3e50", "font-weight": "bold"}),
+            *items
+        ])
+    ], style={"box-shadow": "0 4px 8px rgba(0, 0, 0, 0.1)", "border-radius": "15px", "margin-top": "20px"})
@@ -0,0 +1,352 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+
+# Load generator for the Flask/Dash server.
+#
+# Each virtual user logs in through /login and then drives tab switches and
+# currency conversions through the Dash callback endpoint. Virtual users are
+# asyncio tasks talking HTTP over asyncio streams, so a single thread drives
+# every user and --users is not limited by the number of OS threads.
+#
+# Run against a server that is already up:
+#     python load_test.py --url http://127.0.0.1:5000 --users 20 --duration 30
+# Or let the harness start the app in a separate process on synthetic data:
+#     python load_test.py --start-server --users 20 --duration 30
+
+login_email = 'admin@example.com'
+login_password = 'password'
+callback_path = '/dashboard/_dash-update-component'
+currencies = ['USD', 'EUR', 'INR', 'GBP']
+
+# Function to build the Dash callback payload for switching to a tab
+def tab_callback_payloads(active_tab):
+    inputs = [{'id': 'tabs', 'property': 'active_tab', 'value': active_tab}]
+    changed = ['tabs.active_tab']
+    return {
+        'render_tab_content': {
+            'output': 'tab-content.children',
+            'outputs': {'id': 'tab-content', 'property': 'children'},
+            'inputs': inputs, 'changedPropIds': changed, 'state': []
+        },
+        'update_monthwise_income_expense': {
+            'output': 'income-expense-monthwise.figure',
+            'outputs': {'id': 'income-expense-monthwise', 'property': 'figure'},
+            'inputs': inputs, 'changedPropIds': changed, 'state': []
+        },
+        'update_category_and_savings': {
+            'output': '..category-breakdown.figure...savings-trend.figure..',
+            'outputs': [{'id': 'category-breakdown', 'property': 'figure'},
+                        {'id': 'savings-trend', 'property': 'figure'}],
+            'inputs': inputs, 'changedPropIds': changed, 'state': []
+        },
+    }
+
+# Function to build the Dash callback payload for a currency conversion
+def convert_currency_payload(n_clicks, base, target, amount):
+    return {
+        'output': 'conversion-result.children',
+        'outputs': {'id': 'conversion-result', 'property': 'children'},
+        'inputs': [{'id': 'convert-btn', 'property': 'n_clicks', 'value': n_clicks}],
+        'changedPropIds': ['convert-btn.n_clicks'],
+        'state': [
+            {'id': 'base-currency', 'property': 'value', 'value': base},
+            {'id': 'target-currency', 'property': 'value', 'value': target},
+            {'id': 'amount', 'property': 'value', 'value': amount},
+        ]
+    }
+
+# Raised for malformed or unexpected HTTP responses
+class LoadTestError(Exception):
+    pass
+
+# Function to read an HTTP/1.1 response (status, headers, body) from an asyncio stream
+async def read_http_response(reader):
+    status_line = await reader.readline()
+    parts = status_line.decode('latin-1').split(' ', 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise LoadTestError(f"Malformed status line: {status_line!r}")
+    status = int(parts[1])
+
+    headers = []
+    while True:
+        line = (await reader.readline()).decode('latin-1')
+        if line in ('\r\n', '\n', ''):
+            break
+        name, _, value = line.partition(':')
+        headers.append((name.strip().lower(), value.strip()))
+    header_map = dict(headers)
+
+    if header_map.get('transfer-encoding', '').lower() == 'chunked':
+        body = bytearray()
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                await reader.readline()
+                break
+            body += await reader.readexactly(size)
+            await reader.readline()
+        body = bytes(body)
+    elif 'content-length' in header_map:
+        body = await reader.readexactly(int(header_map['content-length']))
+    else:
+        body = await reader.read()
+    return status, headers, body
+
+# A single virtual user with its own cookies (and therefore its own session)
+class VirtualUser:
+    def __init__(self, base_url, timeout):
+        url = urllib.parse.urlparse(base_url)
+        self.host = url.hostname
+        self.port = url.port or 80
+        self.timeout = timeout
+        self.cookies = {}
+
+    # One connection per request keeps the client simple and matches what the dev server does anyway
+    async def request(self, method, path, body=b'', content_type=None):
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        try:
+            lines = [
+                f"{method} {path} HTTP/1.1",
+                f"Host: {self.host}:{self.port}",
+                'Accept-Encoding: gzip, br',
+                'Connection: close',
+                f"Content-Length: {len(body)}",
+            ]
+            if content_type:
+                lines.append(f"Content-Type: {content_type}")
+            if self.cookies:
+                lines.append('Cookie: ' + '; '.join(f"{name}={value}" for name, value in self.cookies.items()))
+            writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+            await writer.drain()
+            status, headers, body = await asyncio.wait_for(read_http_response(reader), self.timeout)
+        finally:
+            writer.close()
+
+        for name, value in headers:
+            if name == 'set-cookie':
+                cookie_name, _, cookie_value = value.split(';', 1)[0].partition('=')
+                self.cookies[cookie_name.strip()] = cookie_value.strip()
+        return status, dict(headers), body
+
+    async def login(self):
+        form = urllib.parse.urlencode({'email': login_email, 'password': login_password}).encode()
+        status, headers, _ = await self.request('POST', '/login', form, 'application/x-www-form-urlencoded')
+        # A successful login redirects to the dashboard; a failed one re-renders the login page
+        if status != 302 or not urllib.parse.urlparse(headers.get('location', '')).path.startswith('/dashboard'):
+            raise LoadTestError('Login failed')
+
+    async def callback(self, payload):
+        status, _, _ = await self.request('POST', callback_path, json.dumps(payload).encode(), 'application/json')
+        if status != 200:
+            raise LoadTestError(f"Callback returned HTTP {status}")
+
+# Collects per-operation latencies and errors
+class LoadTestStats:
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, name, elapsed):
+        self.latencies.setdefault(name, []).append(elapsed)
+
+    def record_error(self, name):
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def report(self, wall_time):
+        names = sorted(set(self.latencies) | set(self.errors))
+        lines = [f"{'operation':<34}{'count':>8}{'errors':>8}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+        total = 0
+        for name in names:
+            samples = sorted(self.latencies.get(name, []))
+            total += len(samples)
+            p50, p95, p99 = (percentile(samples, p) * 1000 for p in (50, 95, 99))
+            lines.append(
+                f"{name:<34}{len(samples):>8}{self.errors.get(name, 0):>8}"
+                f"{len(samples) / wall_time:>9.1f}{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}"
+            )
+        lines.append(f"Total: {total} requests in {wall_time:.1f}s ({total / wall_time:.1f} req/s)")
+        return '\n'.join(lines)
+
+# Function to compute a percentile from sorted samples (nearest-rank)
+def percentile(sorted_samples, pct):
+    if not sorted_samples:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_samples)), 1)
+    return sorted_samples[rank - 1]
+
+# Function to time one request coroutine and record the outcome
+async def timed(stats, name, request):
+    start = time.perf_counter()
+    try:
+        await request
+    except (OSError, EOFError, ValueError, asyncio.TimeoutError, LoadTestError):
+        # IncompleteReadError is an EOFError, and bad chunk sizes or status codes raise ValueError
+        stats.record_error(name)
+        return False
+    stats.record(name, time.perf_counter() - start)
+    return True
+
+# Coroutine for one virtual user: log in, then alternate tab switches and conversions until the deadline
+async def run_virtual_user(user_id, base_url, deadline, stats, args):
+    rng = random.Random(user_id)
+    user = VirtualUser(base_url, args.timeout)
+    if not await timed(stats, 'login', user.login()):
+        return
+
+    n_clicks = 0
+    while time.monotonic() < deadline:
+        if rng.random() < args.conversion_ratio:
+            n_clicks += 1
+            base, target = rng.sample(currencies, 2)
+            payload = convert_currency_payload(n_clicks, base, target, rng.randint(1, 1000))
+            await timed(stats, 'convert_currency', user.callback(payload))
+        else:
+            # The browser fires all callbacks listening on the tab at once
+            active_tab = rng.choice(['dashboard', 'budget-tracker'])
+            payloads = tab_callback_payloads(active_tab)
+            await asyncio.gather(*[
+                timed(stats, name, user.callback(payload))
+                for name, payload in payloads.items()
+            ])
+        if args.think_time:
+            await asyncio.sleep(rng.uniform(0, args.think_time))
+
+# Function to run the whole load test and return the collected stats
+async def run_load_test(base_url, args):
+    stats = LoadTestStats()
+    deadline = time.monotonic() + args.duration
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        run_virtual_user(user_id, base_url, deadline, stats, args)
+        for user_id in range(args.users)
+    ])
+    return stats, time.perf_counter() - start
+
+# --- Synthetic data and local server ---
+
+# Function to write synthetic transaction and month-wise data into a fresh working directory
+def create_synthetic_workdir(n_transactions, seed=0):
+    import pandas as pd
+
+    rng = random.Random(seed)
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    workdir = tempfile.mkdtemp(prefix='budget-load-test-')
+    data_dir = os.path.join(workdir, 'data')
+    os.makedirs(data_dir)
+
+    with open(os.path.join(app_dir, 'data', 'merchant_categories.json')) as f:
+        merchant_data = json.load(f)
+    merchants = [merchant['merchant'] for merchant in merchant_data['merchants']]
+    shutil.copy(os.path.join(app_dir, 'data', 'merchant_categories.json'), data_dir)
+
+    dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=365)
+    transactions = []
+    for _ in range(n_transactions):
+        if rng.random() < 0.1:
+            transactions.append({'Date': rng.choice(dates), 'Description': 'Salary Deposit',
+                                 'Amount': round(rng.uniform(2000, 6000), 2), 'Transaction Type': 'Credit'})
+        else:
+            transactions.append({'Date': rng.choice(dates), 'Description': f"{rng.choice(merchants)} Purchase",
+                                 'Amount': round(rng.uniform(5, 500), 2), 'Transaction Type': 'Debit'})
+    pd.DataFrame(transactions).sort_values('Date').to_excel(
+        os.path.join(data_dir, 'sample_transaction_sheet.xlsx'), index=False, engine='openpyxl')
+
+    months = pd.date_range(end=pd.Timestamp.today(), periods=12, freq='MS').strftime('%b %Y')
+    pd.DataFrame({
+        'Month': months,
+        'Income': [round(rng.uniform(4000, 6000), 2) for _ in months],
+        'Expense': [round(rng.uniform(2500, 5000), 2) for _ in months],
+    }).to_excel(os.path.join(data_dir, 'monthwise_income_expense.xlsx'), index=False, engine='openpyxl')
+
+    with open(os.path.join(data_dir, 'currency_rates.json'), 'w') as f:
+        json.dump({'rates': {'USD': 1.0, 'EUR': 0.85, 'INR': 83.6, 'GBP': 0.75}}, f)
+    with open(os.path.join(data_dir, 'financial_news.json'), 'w') as f:
+        json.dump({'articles': [
+            {'title': f"Synthetic headline {i}", 'description': 'Synthetic article for load testing.',
+             'url': f"https://example.com/news{i}"}
+            for i in range(10)
+        ]}, f)
+    return workdir
+
+# Function to start the app in its own process so it doesn't share the GIL with the load generator.
+# app.py reads its data relative to the working directory, so the server runs inside the synthetic workdir.
+def start_local_server(workdir, host, port, startup_timeout=60):
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+    log_path = os.path.join(workdir, 'server.log')
+    # The server's access log goes to a file so it doesn't drown out the report
+    with open(log_path, 'w') as log:
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'flask', '--app', app_path, 'run', '--host', host, '--port', str(port), '--no-reload'],
+            cwd=workdir, stdout=log, stderr=subprocess.STDOUT
+        )
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            with open(log_path) as log:
+                raise RuntimeError(f"Server exited with code {server.returncode} during startup:\n{log.read()}")
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return server
+        except OSError:
+            time.sleep(0.2)
+    stop_local_server(server)
+    raise RuntimeError(f"Server did not start listening on {host}:{port} within {startup_timeout}s")
+
+# Function to stop the server process started by start_local_server
+def stop_local_server(server):
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Concurrent load test for the budgeting dashboard.')
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='Base URL of a running server')
+    parser.add_argument('--users', type=int, default=10, help='Number of concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=30, help='Test duration in seconds')
+    parser.add_argument('--think-time', type=float, default=0.0, help='Max random pause between actions (s)')
+    parser.add_argument('--conversion-ratio', type=float, default=0.3, help='Share of actions that are currency conversions')
+    parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout (s)')
+    parser.add_argument('--start-server', action='store_true', help='Start the app in a separate local process on synthetic data')
+    parser.add_argument('--port', type=int, default=5050, help='Port for --start-server')
+    parser.add_argument('--transactions', type=int, default=500, help='Synthetic transactions for --start-server')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    base_url = args.url
+    server = workdir = None
+    if args.start_server:
+        workdir = create_synthetic_workdir(args.transactions)
+        try:
+            server = start_local_server(workdir, '127.0.0.1', args.port)
+        except RuntimeError:
+            shutil.rmtree(workdir, ignore_errors=True)
+            raise
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        print(f"Running {args.users} virtual users against {base_url} for {args.duration:.0f}s...")
+        stats, wall_time = asyncio.run(run_load_test(base_url, args))
+        print(stats.report(wall_time))
+    finally:
+        if server is not None:
+            stop_local_server(server)
+        if workdir is not None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
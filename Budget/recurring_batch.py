@@ -0,0 +1,51 @@
+import argparse
+import os
+
+import pandas as pd
+
+import features
+
+# Nightly batch job for recurring payment detection.
+#
+# Folds newly imported transaction files into the saved state and writes the
+# detected recurring payments. Only groups touched by the new rows are
+# re-summarized, and rows already seen (overlapping imports) are ignored, so
+# the job can be pointed at each night's import without reprocessing history.
+# Several files are folded in one after another, in the order given.
+#
+#     python recurring_batch.py data/imports/2024-06-01.xlsx
+#
+# Delete the state file to force a full recompute.
+
+# Function to read an imported transaction file (Excel or CSV)
+def load_transactions(file_path):
+    if file_path.lower().endswith('.csv'):
+        return pd.read_csv(file_path)
+    return pd.read_excel(file_path, engine='openpyxl')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Detect recurring payments in newly imported transactions.')
+    parser.add_argument('files', nargs='+', help='Transaction files to import (Excel or CSV)')
+    parser.add_argument('--state', default='data/recurring_state.pkl', help='State file carried between runs')
+    parser.add_argument('--output', default='data/recurring_payments.csv', help='Where to write the detected recurring payments')
+    parser.add_argument('--as-of', help='Reference date for dropping stopped charges (default: newest date in the data)')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    state = pd.read_pickle(args.state) if os.path.exists(args.state) else None
+
+    # Each file is its own batch so rows shared by overlapping files are recognised as re-imports
+    imported = 0
+    for file_path in args.files:
+        new_transactions = load_transactions(file_path)
+        state = features.update_recurring_state(new_transactions, state)
+        imported += len(new_transactions)
+    recurring_payments = features.find_recurring_payments(state['summary'], args.as_of)
+
+    pd.to_pickle(state, args.state)
+    recurring_payments.to_csv(args.output, index=False)
+    print(f"Imported {imported} transactions; {len(recurring_payments)} recurring payments written to {args.output}")
+
+if __name__ == '__main__':
+    main()
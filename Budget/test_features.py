@@ -0,0 +1,101 @@
+import sys
+
+import pandas as pd
+
+import features
+import recurring_batch
+
+
+# Function to build a transaction history with a monthly subscription, a cancelled weekly charge and noise
+def make_transactions():
+    start = pd.Timestamp('2022-01-05')
+    rows = []
+    for user_id in (1, 2):
+        for i in range(36):
+            rows.append({'User ID': user_id, 'Date': start + pd.DateOffset(months=i), 'Description': f'NETFLIX.COM #{1000 + i}',
+                         'Amount': 15.99, 'Transaction Type': 'Debit'})
+        for i in range(20):
+            rows.append({'User ID': user_id, 'Date': start + pd.Timedelta(days=7 * i), 'Description': 'City Gym',
+                         'Amount': 10.0, 'Transaction Type': 'Debit'})
+        for i in range(40):
+            rows.append({'User ID': user_id, 'Date': start + pd.Timedelta(days=23 * i), 'Description': 'Walmart Purchase',
+                         'Amount': 5.0 + (i * 37) % 190, 'Transaction Type': 'Debit'})
+        # A genuine second charge on the same day, plus a salary credit that must be ignored
+        rows.append({'User ID': user_id, 'Date': start + pd.Timedelta(days=92), 'Description': 'Walmart Purchase',
+                     'Amount': 5.0, 'Transaction Type': 'Debit'})
+        rows.append({'User ID': user_id, 'Date': start, 'Description': 'Salary Deposit',
+                     'Amount': 4000.0, 'Transaction Type': 'Credit'})
+    return pd.DataFrame(rows)
+
+
+def sorted_summary(state):
+    return state['summary'].sort_values(['User ID', 'Merchant Key']).reset_index(drop=True)
+
+
+def test_incremental_run_matches_full_run_with_overlapping_batches():
+    transactions = make_transactions().sort_values('Date').reset_index(drop=True)
+    cutoff = pd.Timestamp('2023-06-01')
+    first_batch = transactions[transactions['Date'] < cutoff]
+    # The second import overlaps the first by two months and includes a back-posted charge from last year
+    second_batch = transactions[transactions['Date'] >= cutoff - pd.Timedelta(days=60)]
+    back_posted = pd.DataFrame([{'User ID': 1, 'Date': pd.Timestamp('2022-08-20'), 'Description': 'Walmart Purchase',
+                                 'Amount': 42.0, 'Transaction Type': 'Debit'}])
+
+    full_recurring, full_state = features.detect_recurring_payments(pd.concat([transactions, back_posted]))
+    _, state = features.detect_recurring_payments(first_batch)
+    recurring, state = features.detect_recurring_payments(pd.concat([second_batch, back_posted]), state)
+
+    assert len(state['history']) == len(full_state['history'])
+    pd.testing.assert_frame_equal(sorted_summary(state), sorted_summary(full_state), check_like=True)
+    pd.testing.assert_frame_equal(recurring, full_recurring)
+
+
+def test_detects_active_subscriptions_and_drops_cancelled_ones():
+    recurring, _ = features.detect_recurring_payments(make_transactions())
+
+    assert set(recurring['Merchant Key']) == {'netflix com'}
+    assert (recurring['Cadence'] == 'Monthly').all()
+    assert (recurring['Average Amount'] == 15.99).all()
+
+
+def test_repeated_transaction_ids_in_first_batch_are_deduplicated():
+    netflix = pd.DataFrame([
+        {'Transaction ID': f'N{i}', 'Date': pd.Timestamp('2024-01-05') + pd.DateOffset(months=i), 'Description': 'Netflix',
+         'Amount': 15.99, 'Transaction Type': 'Debit'}
+        for i in range(6)
+    ])
+    spotify = pd.DataFrame([
+        {'Transaction ID': f'S{i}', 'Date': pd.Timestamp('2024-01-10') + pd.DateOffset(months=i), 'Description': 'Spotify',
+         'Amount': 9.99, 'Transaction Type': 'Debit'}
+        for i in range(6)
+    ])
+    first_batch = pd.concat([netflix, netflix.iloc[:3]], ignore_index=True)
+
+    _, state = features.detect_recurring_payments(first_batch)
+    _, state = features.detect_recurring_payments(spotify, state)
+    _, full_state = features.detect_recurring_payments(pd.concat([netflix, spotify]))
+
+    assert len(state['history']) == 12
+    summary = state['summary'].sort_values('Merchant Key').reset_index(drop=True)
+    full_summary = full_state['summary'].sort_values('Merchant Key').reset_index(drop=True)
+    pd.testing.assert_frame_equal(summary, full_summary, check_like=True)
+
+
+def test_batch_job_deduplicates_overlapping_files_in_one_run(tmp_path, monkeypatch):
+    netflix = pd.DataFrame([
+        {'Date': pd.Timestamp('2024-01-05') + pd.DateOffset(months=i), 'Description': 'Netflix',
+         'Amount': 15.99, 'Transaction Type': 'Debit'}
+        for i in range(12)
+    ])
+    netflix.iloc[:8].to_csv(tmp_path / 'first.csv', index=False)
+    netflix.iloc[4:].to_csv(tmp_path / 'second.csv', index=False)
+    state_file, output_file = tmp_path / 'state.pkl', tmp_path / 'recurring.csv'
+
+    monkeypatch.setattr(sys, 'argv', ['recurring_batch.py', str(tmp_path / 'first.csv'), str(tmp_path / 'second.csv'),
+                                      '--state', str(state_file), '--output', str(output_file)])
+    recurring_batch.main()
+
+    assert len(pd.read_pickle(state_file)['history']) == 12
+    recurring = pd.read_csv(output_file)
+    assert list(recurring['Merchant Key']) == ['netflix']
+    assert list(recurring['Cadence']) == ['Monthly']